@@ -1,8 +1,14 @@
+import os
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import json
 
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csv_cache import read_csv_cached
+
 def calculate_allan_deviation(data, Fs):
     """
     Calculate the Allan deviation for a given dataset and sampling frequency.
@@ -233,10 +239,14 @@ if __name__ == '__main__':
     # Extract data from config file
     file_path = config['filePath']
     data_field = config['dataField']
+    use_cache = config.get('useCache', True)
     Fs=100
 
-    # Read data from CSV
-    df = pd.read_csv(file_path)
+    # Read only the data field from CSV, through the sidecar cache unless disabled
+    if use_cache:
+        df = read_csv_cached(file_path, [data_field])
+    else:
+        df = pd.read_csv(file_path, usecols=[data_field])
 
     # Extract data from the specified field
     data = df[data_field].to_numpy()
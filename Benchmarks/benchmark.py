@@ -0,0 +1,334 @@
+import os
+import sys
+import json
+import time
+import runpy
+import shutil
+import platform
+import resource
+import tempfile
+import multiprocessing
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# Make the repository scripts importable
+benchmark_dir = os.path.dirname(os.path.abspath(__file__))
+repo_root = os.path.join(benchmark_dir, '..')
+sys.path.append(repo_root)
+sys.path.append(os.path.join(repo_root, 'Allan Deviation'))
+sys.path.append(os.path.join(repo_root, 'Data Plotter'))
+
+# Imported here so that the spawned benchmark processes load them before any timer starts
+from ads_parser import read_and_parse_format_file, parse_and_write_packets, decode_packets
+from allan_dev import calculate_allan_deviation
+from plotter import plot_data
+from csv_cache import cache_dir_for
+from generate_data import (HEADER_BYTES, write_format_file, write_binary_file,
+                           generate_gyro_series, write_pass_folders)
+
+# Config fields that change the measured workload, runs are only comparable when they match
+WORKLOAD_FIELDS = ['packetFormat', 'packetCount', 'corruptionRate', 'seed', 'samplingFrequency',
+                   'adevSamples', 'passCount', 'rowsPerPass', 'plotColumns']
+
+def _peak_rss_mb():
+    """
+    Returns the peak resident set size of the current process in megabytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def _timed(func, args, repeats, setup):
+    """
+    Runs a function several times and measures the wall time of each run and the peak RSS
+    of the process. Executed in a fresh child process, so the peak RSS belongs to these runs only.
+    """
+    seconds = []
+    for _ in range(repeats):
+        # Untimed preparation, it returns the arguments of the measured call
+        call_args = setup(*args) if setup else args
+        start = time.perf_counter()
+        result = func(*call_args)
+        seconds.append(time.perf_counter() - start)
+    return seconds, result, _peak_rss_mb()
+
+def measure(func, *args, repeats=1, setup=None):
+    """
+    Runs a benchmark function repeatedly in a freshly spawned process.
+
+    Args:
+        func (callable): Module level function to run.
+        *args: Arguments passed to the function, or to setup when given.
+        repeats (int, optional): Number of timed runs. Defaults to 1.
+        setup (callable, optional): Module level function run before each timed run, outside
+            the timer. It receives args and returns the arguments of func. Defaults to None.
+
+    Returns:
+        dict: Minimum and median wall time in seconds, number of runs, peak RSS in MB,
+            and the return value of the last run ('result').
+    """
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        seconds, result, peak_rss = pool.apply(_timed, (func, args, repeats, setup))
+    return {
+        'seconds': min(seconds),
+        'median_seconds': float(np.median(seconds)),
+        'repeats': repeats,
+        'peak_rss_mb': peak_rss,
+        'result': result
+    }
+
+def prepare_parse_and_write(binary_file_path, format_file_path, output_file):
+    """
+    Benchmark setup: removes the CSV written by the previous run, since the parser appends to it.
+    """
+    if os.path.exists(output_file):
+        os.remove(output_file)
+    return binary_file_path, format_file_path, output_file
+
+def run_parse_and_write(binary_file_path, format_file_path, output_file):
+    """
+    Benchmark body: parses a binary file to CSV with parse_and_write_packets.
+    """
+    packet_format = read_and_parse_format_file(format_file_path)
+    with open(binary_file_path, 'rb') as file:
+        data = file.read()
+    parse_and_write_packets(data, HEADER_BYTES, packet_format, output_file)
+
+def run_decode(binary_file_path, format_file_path):
+    """
+    Benchmark body: decodes a binary file to NumPy arrays with decode_packets.
+    """
+    packet_format = read_and_parse_format_file(format_file_path)
+    with open(binary_file_path, 'rb') as file:
+        data = file.read()
+    decoded = decode_packets(data, HEADER_BYTES, packet_format)
+    return len(next(iter(decoded.values())))
+
+def prepare_adev(sample_count, Fs):
+    """
+    Benchmark setup: generates the synthetic gyro series outside the timer.
+    """
+    return generate_gyro_series(sample_count, Fs), Fs
+
+def run_adev(data, Fs):
+    """
+    Benchmark body: computes the Allan deviation of a gyro series.
+    """
+    calculate_allan_deviation(data, Fs)
+
+def run_csv_parser(work_dir):
+    """
+    Benchmark body: runs csv_parser.py on a pass folder tree, from a folder holding its config.json.
+    """
+    os.chdir(work_dir)
+    runpy.run_path(os.path.join(repo_root, 'csv_parser.py'), run_name='__main__')
+
+def prepare_plot_data_warm(csv_file_path, columns, output_file):
+    """
+    Benchmark setup: closes the figures left by the previous run.
+    """
+    plt.close('all')
+    return csv_file_path, columns, output_file
+
+def prepare_plot_data_cold(csv_file_path, columns, output_file):
+    """
+    Benchmark setup: closes the previous figures and removes the sidecar cache so that plot_data reads the CSV.
+    """
+    shutil.rmtree(cache_dir_for(csv_file_path), ignore_errors=True)
+    return prepare_plot_data_warm(csv_file_path, columns, output_file)
+
+def run_plot_data(csv_file_path, columns, output_file):
+    """
+    Benchmark body: plots columns of a CSV file with plot_data.
+    """
+    plot_data(csv_file_path, columns, output_file=output_file)
+
+def count_csv_rows(file_path):
+    """
+    Counts the data rows of a CSV file (without the header row).
+    """
+    with open(file_path, 'rb') as file:
+        return max(sum(1 for _ in file) - 1, 0)
+
+def run_benchmarks(config, work_dir):
+    """
+    Generates the synthetic data and runs every benchmark.
+
+    Args:
+        config (dict): Benchmark parameters (see README.md).
+        work_dir (str): Folder where the synthetic data and outputs are written.
+
+    Returns:
+        dict: Benchmark results, one entry per benchmark.
+    """
+    seed = config.get('seed', 0)
+    Fs = config.get('samplingFrequency', 100)
+    repeats = config.get('repeats', 5)
+    results = {}
+
+    # Synthetic binary telemetry
+    format_file_path = config.get('packetFormat')
+    if format_file_path is None:
+        format_file_path = os.path.join(work_dir, 'format.txt')
+        write_format_file(format_file_path)
+
+    binary_file_path = os.path.join(work_dir, 'telemetry.bin')
+    size = write_binary_file(binary_file_path, format_file_path, config.get('packetCount', 20000),
+                             config.get('corruptionRate', 0.01), seed)
+    size_mb = size / 1024 ** 2
+
+    # Packet parser writing CSV
+    print("Benchmarking parse_and_write_packets...")
+    csv_file_path = os.path.join(work_dir, 'telemetry.csv')
+    timing = measure(run_parse_and_write, binary_file_path, format_file_path, csv_file_path,
+                     repeats=repeats, setup=prepare_parse_and_write)
+    timing.pop('result')
+    packets = count_csv_rows(csv_file_path)
+    results['parse_and_write_packets'] = dict(timing, bytes=size, packets=packets,
+                                              mb_per_s=size_mb / timing['seconds'],
+                                              packets_per_s=packets / timing['seconds'])
+
+    # Packet decoder writing NumPy arrays
+    print("Benchmarking decode_packets...")
+    timing = measure(run_decode, binary_file_path, format_file_path, repeats=repeats)
+    packets = timing.pop('result')
+    results['decode_packets'] = dict(timing, bytes=size, packets=packets,
+                                     mb_per_s=size_mb / timing['seconds'],
+                                     packets_per_s=packets / timing['seconds'])
+
+    # Allan deviation time versus number of samples
+    results['calculate_allan_deviation'] = []
+    for sample_count in config.get('adevSamples', [10000, 100000, 1000000]):
+        print(f"Benchmarking calculate_allan_deviation with N={sample_count}...")
+        timing = measure(run_adev, sample_count, Fs, repeats=repeats, setup=prepare_adev)
+        timing.pop('result')
+        results['calculate_allan_deviation'].append(dict(timing, samples=sample_count,
+                                                         samples_per_s=sample_count / timing['seconds']))
+
+    # Pass folder tree through csv_parser.py, it overwrites its outputs so runs can be repeated
+    print("Benchmarking csv_parser.py...")
+    pass_count = config.get('passCount', 10)
+    rows_per_pass = config.get('rowsPerPass', 10000)
+    csv_parser_dir = os.path.join(work_dir, 'csv_parser')
+    os.makedirs(csv_parser_dir)
+    csv_parser_config = write_pass_folders(os.path.join(work_dir, 'passes'), pass_count, rows_per_pass, seed=seed)
+    csv_parser_config['outputFolder'] = os.path.join(csv_parser_dir, 'output')
+    with open(os.path.join(csv_parser_dir, 'config.json'), 'w') as f:
+        json.dump(csv_parser_config, f)
+    timing = measure(run_csv_parser, csv_parser_dir, repeats=repeats)
+    timing.pop('result')
+    rows = pass_count * rows_per_pass
+    results['csv_parser'] = dict(timing, files=pass_count, rows=rows, rows_per_s=rows / timing['seconds'])
+
+    # plot_data on the parser output, without the sidecar cache and then with it
+    columns = config.get('plotColumns', ['gyro1', 'gyro2', 'gyro3'])
+    plot_file_path = os.path.join(work_dir, 'plot.png')
+    for run, setup in (('cold_cache', prepare_plot_data_cold), ('warm_cache', prepare_plot_data_warm)):
+        print(f"Benchmarking plot_data ({run})...")
+        timing = measure(run_plot_data, csv_file_path, columns, plot_file_path, repeats=repeats, setup=setup)
+        timing.pop('result')
+        results[f'plot_data_{run}'] = dict(timing, rows=packets, rows_per_s=packets / timing['seconds'])
+
+    return results
+
+def _rate(entry):
+    """
+    Returns the name and value of the throughput reported by a benchmark entry.
+    """
+    for key in ('packets_per_s', 'rows_per_s', 'samples_per_s'):
+        if key in entry:
+            return key, entry[key]
+    raise KeyError(f"No throughput found in benchmark entry: {entry}")
+
+def compare_results(baseline, current, tolerance=0.1):
+    """
+    Compares two benchmark result files and lists the throughputs that got lower.
+
+    Throughputs (packets/s, rows/s, samples/s) are compared rather than raw times,
+    and only between runs made with the same workload settings.
+
+    Args:
+        baseline (dict): Results of the reference run.
+        current (dict): Results of the new run.
+        tolerance (float, optional): Relative slowdown allowed before reporting a regression. Defaults to 0.1.
+
+    Returns:
+        list: One message per regression.
+    """
+    # Different workloads cannot be compared
+    differences = [field for field in WORKLOAD_FIELDS
+                   if baseline['config'].get(field) != current['config'].get(field)]
+    if differences:
+        raise ValueError(f"Baseline was run with different workload settings: {differences}")
+
+    regressions = []
+
+    def check(name, old, new):
+        key, old_rate = _rate(old)
+        _, new_rate = _rate(new)
+        if new_rate < old_rate / (1 + tolerance):
+            regressions.append(f"{name}: {old_rate:.1f} -> {new_rate:.1f} {key} "
+                               f"({(new_rate / old_rate - 1) * 100:+.1f}%)")
+
+    for name, new in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        if isinstance(new, list):
+            # Series such as ADEV versus N are matched on their sample count
+            old_by_samples = {entry['samples']: entry for entry in old}
+            for entry in new:
+                if entry['samples'] in old_by_samples:
+                    check(f"{name} (N={entry['samples']})", old_by_samples[entry['samples']], entry)
+        else:
+            check(name, old, new)
+
+    return regressions
+
+if __name__ == '__main__':
+
+    # Load the configuration file
+    with open('config.json') as f:
+        config = json.load(f)
+
+    # Generate the data in a temporary folder, kept only if asked
+    work_dir = tempfile.mkdtemp(prefix='hex20_bench_')
+    try:
+        results = run_benchmarks(config, work_dir)
+    finally:
+        if not config.get('keepData', False):
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'config': config,
+        'results': results
+    }
+
+    output_file = config.get('outputFile', 'benchmark_results.json')
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(results, indent=2))
+    print(f"Saved results to {output_file}")
+
+    # Compare against a previous run to spot regressions
+    baseline_file = config.get('baselineFile')
+    if baseline_file:
+        with open(baseline_file) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, report, config.get('tolerance', 0.1))
+        if regressions:
+            print("Regressions compared to", baseline_file)
+            for regression in regressions:
+                print("  " + regression)
+            sys.exit(1)
+        print("No regressions compared to", baseline_file)
@@ -0,0 +1,214 @@
+import os
+import sys
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ads_parser import read_and_parse_format_file, NUMPY_TYPES
+
+HEADER_BYTES = b'\x48\x32\x30'  # sync_word = H20 in hex
+
+# Format used when no format file is given, the first field holds the packet length
+DEFAULT_FORMAT = """# Synthetic telemetry packet
+APPEND packet_length 8 UINT 8
+APPEND counter 32 UINT 32
+APPEND status 16 UINT 16
+APPEND_ARRAY_ITEM gyro 32 FLOAT 96
+APPEND_ARRAY_ITEM accel 32 FLOAT 96
+APPEND temperature 32 FLOAT 32
+"""
+
+def write_format_file(file_path, format_text=DEFAULT_FORMAT):
+    """
+    Writes a packet format file.
+
+    Args:
+        file_path (str): Path of the format file to write.
+        format_text (str, optional): Content of the format file. Defaults to DEFAULT_FORMAT.
+    """
+    with open(file_path, 'w') as file:
+        file.write(format_text)
+
+def generate_packets(packet_format, packet_count, corruption_rate=0.0, seed=0):
+    """
+    Generates H20-framed binary packets following a packet format.
+
+    The first byte after the header holds the packet length, as expected by the parsers.
+    UINT fields hold uniform random values and FLOAT fields hold unit Gaussian noise.
+
+    Args:
+        packet_format (list): List of dictionaries describing the packet fields,
+            as returned by read_and_parse_format_file.
+        packet_count (int): Number of packets to generate.
+        corruption_rate (float, optional): Fraction of packets that get a random byte
+            overwritten, and of gaps between packets that get random noise bytes. Defaults to 0.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        bytes: The generated binary data.
+    """
+    rng = np.random.default_rng(seed)
+    field_sizes = [struct.calcsize(field['format']) for field in packet_format]
+    packet_size = len(HEADER_BYTES) + sum(field_sizes)
+    if packet_size > 255:
+        raise ValueError(f"Packet size {packet_size} does not fit in the one byte length field.")
+
+    # Build all packets at once, one row of bytes per packet
+    packets = np.zeros((packet_count, packet_size), dtype=np.uint8)
+    packets[:, :len(HEADER_BYTES)] = np.frombuffer(HEADER_BYTES, dtype=np.uint8)
+
+    offset = len(HEADER_BYTES)
+    for field, byte_size in zip(packet_format, field_sizes):
+        dtype = np.dtype(NUMPY_TYPES[field['format'][-1]])
+        count = byte_size // dtype.itemsize
+        if dtype.kind == 'f':
+            values = rng.standard_normal((packet_count, count)).astype(dtype)
+        else:
+            values = rng.integers(0, np.iinfo(dtype).max, (packet_count, count), endpoint=True).astype(dtype)
+        packets[:, offset:offset + byte_size] = values.view(np.uint8).reshape(packet_count, byte_size)
+        offset += byte_size
+
+    # Length byte, so that the next header is found right after the packet
+    packets[:, len(HEADER_BYTES)] = packet_size
+
+    if corruption_rate <= 0:
+        return packets.tobytes()
+
+    # Overwrite one random byte in a fraction of the packets
+    corrupted = np.flatnonzero(rng.random(packet_count) < corruption_rate)
+    positions = rng.integers(0, packet_size, len(corrupted))
+    packets[corrupted, positions] = rng.integers(0, 256, len(corrupted))
+
+    # Insert random noise bytes between a fraction of the packets
+    chunks = []
+    noisy_gaps = rng.random(packet_count) < corruption_rate
+    for packet, noisy in zip(packets, noisy_gaps):
+        chunks.append(packet.tobytes())
+        if noisy:
+            chunks.append(rng.integers(0, 256, rng.integers(1, packet_size), dtype=np.uint8).tobytes())
+    return b''.join(chunks)
+
+def write_binary_file(file_path, format_file_path, packet_count, corruption_rate=0.0, seed=0):
+    """
+    Writes a synthetic binary telemetry file following a format file.
+
+    Args:
+        file_path (str): Path of the binary file to write.
+        format_file_path (str): Path to the format file describing the packet fields.
+        packet_count (int): Number of packets to generate.
+        corruption_rate (float, optional): See generate_packets. Defaults to 0.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+    packet_format = read_and_parse_format_file(format_file_path)
+    data = generate_packets(packet_format, packet_count, corruption_rate, seed)
+    with open(file_path, 'wb') as file:
+        file.write(data)
+    return len(data)
+
+def generate_gyro_series(sample_count, Fs=100, N=1e-3, K=1e-5, bias=1e-2, seed=0):
+    """
+    Generates a synthetic gyro rate series with known noise parameters.
+
+    Args:
+        sample_count (int): Number of samples.
+        Fs (float, optional): Sampling frequency. Defaults to 100.
+        N (float, optional): Angle random walk coefficient (white rate noise). Defaults to 1e-3.
+        K (float, optional): Rate random walk coefficient (integrated white noise). Defaults to 1e-5.
+        bias (float, optional): Constant rate bias. Defaults to 1e-2.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        numpy.ndarray: The gyro rate samples.
+    """
+    rng = np.random.default_rng(seed)
+    t0 = 1 / Fs
+
+    # White rate noise with PSD N^2 and a random walk of the rate with PSD K^2
+    white = N / np.sqrt(t0) * rng.standard_normal(sample_count)
+    random_walk = np.cumsum(K * np.sqrt(t0) * rng.standard_normal(sample_count))
+
+    return bias + white + random_walk
+
+def write_pass_folders(folder_root, folder_count, rows_per_file, folder_key='pass', folder_path='data',
+                       filename='tlm.csv', columns=('Column1', 'Column2', 'Column3'), seed=0):
+    """
+    Writes a tree of pass folders in the layout read by csv_parser.py:
+    <folder_root>/<folder_key>_<i>/<folder_path>/<filename>
+
+    Args:
+        folder_root (str): Root folder of the tree.
+        folder_count (int): Number of pass folders.
+        rows_per_file (int): Number of rows in each CSV file.
+        folder_key (str, optional): Text contained in every pass folder name. Defaults to 'pass'.
+        folder_path (str, optional): Sub folder holding the CSV file. Defaults to 'data'.
+        filename (str, optional): Name of the CSV file. Defaults to 'tlm.csv'.
+        columns (tuple, optional): Data columns written besides the time stamp. Defaults to three columns.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        dict: The configuration to use with csv_parser.py for this tree (without 'outputFolder').
+    """
+    rng = np.random.default_rng(seed)
+    start_time = 1.7e9  # Seconds since epoch
+
+    for i in range(folder_count):
+        folder = os.path.join(folder_root, f'{folder_key}_{i}', folder_path)
+        os.makedirs(folder, exist_ok=True)
+
+        # Shuffled time stamps so the parser has to sort them
+        time_stamps = start_time + i * rows_per_file + rng.permutation(rows_per_file).astype(float)
+        df = pd.DataFrame({'DAXSS Time Stamp (seconds)': time_stamps})
+        for col in columns:
+            values = rng.standard_normal(rows_per_file)
+            values[rng.random(rows_per_file) < 0.01] = np.nan  # A few missing values
+            df[col] = values
+        df.to_csv(os.path.join(folder, filename), index=False)
+
+    return {
+        'fileDetails': {
+            'folderRoot': folder_root,
+            'folderKey': folder_key,
+            'folderPath': folder_path,
+            'filename': filename
+        },
+        'csvAttributes': {
+            'requiredColumns': ['DAXSS Time Stamp (seconds)'] + list(columns),
+            'sortBasedOnColumn': 'DAXSS Time Stamp (seconds)',
+            'defaultValueForNullValues': 0
+        }
+    }
+
+if __name__ == '__main__':
+
+    # Load the configuration file
+    with open('config.json') as f:
+        config = json.load(f)
+
+    output_folder = config.get('dataFolder', 'synthetic_data')
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Use the given format file, or write the default one
+    format_file_path = config.get('packetFormat')
+    if format_file_path is None:
+        format_file_path = os.path.join(output_folder, 'format.txt')
+        write_format_file(format_file_path)
+
+    binary_file_path = os.path.join(output_folder, 'telemetry.bin')
+    size = write_binary_file(binary_file_path, format_file_path, config.get('packetCount', 100000),
+                             config.get('corruptionRate', 0.01), config.get('seed', 0))
+    print(f"Wrote {size} bytes to {binary_file_path}")
+
+    gyro_file_path = os.path.join(output_folder, 'gyro.csv')
+    gyro = generate_gyro_series(config.get('gyroSamples', 1000000), seed=config.get('seed', 0))
+    pd.DataFrame({'gyro': gyro}).to_csv(gyro_file_path, index=False)
+    print(f"Wrote {len(gyro)} gyro samples to {gyro_file_path}")
+
+    write_pass_folders(os.path.join(output_folder, 'passes'), config.get('passCount', 10),
+                       config.get('rowsPerPass', 10000), seed=config.get('seed', 0))
+    print(f"Wrote pass folders to {os.path.join(output_folder, 'passes')}")
@@ -1,9 +1,17 @@
+import os
+import sys
+import time
+from collections import deque
 import matplotlib.pyplot as plt
 import pandas as pd
 import json
 
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from csv_cache import read_csv_cached
+
 # Function to plot generic data from a CSV
-def plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'black'], figsize=(15, 10), x_axis=None,output_file=None):
+def plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'black'], figsize=(15, 10), x_axis=None,output_file=None, use_cache=True, data=None):
     """
     Plots data from specified columns in a CSV file.
 
@@ -14,6 +22,10 @@ def plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'b
         colors (list, optional): List of colors for each plot (optional). Defaults to ['blue', 'green', 'red', 'black'].
         figsize (tuple, optional): Size of the figure (optional). Defaults to (15, 10).
         x_axis (str, optional): Name of the column to be used as the x-axis (optional). Defaults to index.
+        output_file (str, optional): Path of the output image (optional). Defaults to '<filename>_<first column>.png'.
+        use_cache (bool, optional): Load the columns through the binary sidecar cache (optional). Defaults to True.
+        data (DataFrame or dict, optional): Data already in memory, used instead of reading the CSV file (optional).
+            filename is then only used to name the output image. Defaults to None.
 
     Example Usage:
         Replace with your actual file path and desired columns:
@@ -26,8 +38,15 @@ def plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'b
 
     """
 
-    # Read data from CSV
-    df = pd.read_csv(filename)
+    # Use the data given in memory, otherwise read only the needed columns,
+    # through the sidecar cache unless disabled
+    needed_columns = list(columns) + ([x_axis] if x_axis and x_axis not in columns else [])
+    if data is not None:
+        df = pd.DataFrame({col: data[col] for col in needed_columns})
+    elif use_cache:
+        df = read_csv_cached(filename, needed_columns)
+    else:
+        df = pd.read_csv(filename, usecols=needed_columns)
 
     # Create the figure
     plt.figure(figsize=figsize)
@@ -60,6 +79,185 @@ def plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'b
         plot_name = filename.split('.')[0] + '_' + columns[0]+'.png'
         plt.savefig(plot_name)
 
+def read_new_rows(file, pending):
+    """
+    Reads the rows appended to a CSV file since the last call.
+
+    Args:
+        file (file object): CSV file opened in binary mode, positioned after the last read.
+        pending (bytes): Incomplete last line left over from the previous call.
+
+    Returns:
+        tuple: (list of complete rows split into fields, new incomplete last line)
+    """
+    chunk = file.read()
+    if not chunk:
+        return [], pending
+
+    # The writer may be in the middle of a row, keep the partial line for later
+    lines = (pending + chunk).split(b'\n')
+    pending = lines.pop()
+
+    rows = [line.decode().rstrip('\r').split(',') for line in lines if line.strip()]
+    return rows, pending
+
+def seek_to_last_rows(file, start, row_count, block_size=65536):
+    """
+    Moves a CSV file to the start of one of its last lines, roughly row_count lines before the end,
+    so that attaching to a large capture does not read the whole file.
+
+    Args:
+        file (file object): CSV file opened in binary mode.
+        start (int): Offset of the first data row (right after the header).
+        row_count (int): Minimum number of complete lines to keep before the end of the file.
+        block_size (int, optional): Number of bytes read at a time while scanning backwards. Defaults to 65536.
+    """
+    position = file.seek(0, os.SEEK_END)
+    newlines = 0
+
+    # Scan backwards block by block until enough lines are found
+    while position > start and newlines <= row_count:
+        step = min(block_size, position - start)
+        position -= step
+        file.seek(position)
+        newlines += file.read(step).count(b'\n')
+
+    file.seek(position)
+    if position > start:
+        file.readline()  # Resync to the start of the next complete line
+
+def live_plot_data(filename, columns, labels=None, colors=['blue', 'green', 'red', 'black'], figsize=(15, 10), x_axis=None,
+                   buffer_size=2000, max_fps=10, poll_interval=0.05):
+    """
+    Plots data from specified columns of a CSV file live, while rows are being appended to it.
+
+    Only the rows added since the last frame are read, starting from about the last buffer_size
+    rows when the file is already large. The latest buffer_size points of each series are kept
+    in a fixed-size ring buffer and the lines are redrawn with blitting at most max_fps times per
+    second, so the cost of a frame does not grow with the capture. The plot runs until its window
+    is closed, which requires an interactive matplotlib backend.
+
+    Args:
+        filename (str): Path to the CSV file.
+        columns (list): List of column names to be plotted.
+        labels (list, optional): List of labels for each plot (optional). Defaults to None.
+        colors (list, optional): List of colors for each plot (optional). Defaults to ['blue', 'green', 'red', 'black'].
+        figsize (tuple, optional): Size of the figure (optional). Defaults to (15, 10).
+        x_axis (str, optional): Name of the column to be used as the x-axis (optional).
+            Defaults to the index of the rows read since the plot started.
+        buffer_size (int, optional): Number of points kept per series (optional). Defaults to 2000.
+        max_fps (float, optional): Maximum number of redraws per second (optional). Defaults to 10.
+        poll_interval (float, optional): Seconds to wait while the CSV file has no header yet (optional). Defaults to 0.05.
+    """
+
+    # Check if labels are provided, otherwise use column names
+    if labels is None:
+        labels = columns
+    x_label = x_axis if x_axis else 'index'
+
+    # Create the figure, lines are animated so they are left out of the background
+    fig, axes = plt.subplots(len(columns), 1, figsize=figsize, squeeze=False)
+    axes = axes[:, 0]
+
+    # A non-interactive backend (e.g. Agg) never shows or closes the window
+    if fig.canvas.required_interactive_framework is None or not fig.canvas.supports_blit:
+        plt.close(fig)
+        raise RuntimeError(f"Live plotting needs an interactive matplotlib backend with blitting support, "
+                           f"the current backend is '{plt.get_backend()}'.")
+
+    lines = []
+    for i, ax in enumerate(axes):
+        line, = ax.plot([], [], label=labels[i], color=colors[i % len(colors)], animated=True)
+        lines.append(line)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(labels[i])
+        ax.grid(True)
+        ax.set_ylim(-100, 100)  # Adjust based on data range
+        ax.set_xlim(0, 1)
+        ax.set_title(f'{labels[i]} vs {x_label}')
+        ax.legend(loc='upper right')
+    fig.tight_layout()
+
+    # Wait for the writer to create the file and write the header row
+    while not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        time.sleep(poll_interval)
+
+    with open(filename, 'rb') as file:
+        header = file.readline()
+        while not header.endswith(b'\n'):
+            time.sleep(poll_interval)
+            header += file.readline()
+        header = header.decode().strip().split(',')
+
+        # Map each plotted column to its position in a row
+        try:
+            column_indices = [header.index(col) for col in columns]
+            x_index = header.index(x_axis) if x_axis else None
+        except ValueError:
+            plt.close(fig)
+            missing = [col for col in list(columns) + ([x_axis] if x_axis else []) if col not in header]
+            raise KeyError(f"Columns not found in '{filename}': {missing}")
+
+        # Skip the rows that would not fit in the ring buffers anyway
+        seek_to_last_rows(file, file.tell(), buffer_size)
+
+        # Fixed-size ring buffers, old points are dropped as new ones arrive
+        x_buffer = deque(maxlen=buffer_size)
+        y_buffers = [deque(maxlen=buffer_size) for _ in columns]
+        row_count = 0
+        pending = b''
+
+        # Save the static background after every full draw (first show, resize, rescale)
+        backgrounds = []
+        def save_backgrounds(event):
+            backgrounds[:] = [fig.canvas.copy_from_bbox(ax.bbox) for ax in axes]
+        fig.canvas.mpl_connect('draw_event', save_backgrounds)
+
+        plt.show(block=False)
+        plt.pause(0.1)
+
+        frame_period = 1.0 / max_fps
+        while plt.fignum_exists(fig.number):
+            frame_start = time.time()
+
+            # Append only the new rows to the ring buffers
+            rows, pending = read_new_rows(file, pending)
+            for row in rows:
+                try:
+                    x_value = float(row[x_index]) if x_index is not None else row_count
+                    y_values = [float(row[col_index]) for col_index in column_indices]
+                except (ValueError, IndexError):
+                    # Skip repeated headers and malformed rows
+                    continue
+                x_buffer.append(x_value)
+                for y_buffer, y_value in zip(y_buffers, y_values):
+                    y_buffer.append(y_value)
+                row_count += 1
+
+            if x_buffer:
+                # A full redraw is only needed when the data leaves the x range,
+                # extra headroom keeps that rare
+                x_min, x_max = axes[0].get_xlim()
+                if x_buffer[0] < x_min or x_buffer[-1] > x_max:
+                    span = max(x_buffer[-1] - x_buffer[0], 1)
+                    for ax in axes:
+                        ax.set_xlim(x_buffer[0], x_buffer[-1] + 0.25 * span)
+                    fig.canvas.draw()
+
+                # Blit the lines over the saved backgrounds
+                for ax, line, background, y_buffer in zip(axes, lines, backgrounds, y_buffers):
+                    fig.canvas.restore_region(background)
+                    line.set_data(x_buffer, y_buffer)
+                    ax.draw_artist(line)
+                    fig.canvas.blit(ax.bbox)
+
+            fig.canvas.flush_events()
+
+            # Cap the frame rate
+            elapsed = time.time() - frame_start
+            if elapsed < frame_period:
+                time.sleep(frame_period - elapsed)
+
 if __name__ == '__main__':
 
     #Load the configuration file
@@ -73,6 +271,12 @@ if __name__ == '__main__':
 
     x_axis_to_use = config.get("x_axis_column_name")  # Optional, specify x-axis column name
     output_file = config.get("output_file")
+    use_cache = config.get("use_cache", True)  # Optional, disable the sidecar cache
 
-    # Call the function to plot the data
-    plot_data(filename, columns_to_plot, labels, x_axis=x_axis_to_use,output_file=output_file)
+    if config.get("live", False):
+        # Follow the CSV while it is being written
+        live_plot_data(filename, columns_to_plot, labels, x_axis=x_axis_to_use,
+                       buffer_size=config.get("buffer_size", 2000), max_fps=config.get("max_fps", 10))
+    else:
+        # Call the function to plot the data
+        plot_data(filename, columns_to_plot, labels, x_axis=x_axis_to_use,output_file=output_file, use_cache=use_cache)
@@ -0,0 +1,98 @@
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+
+from ads_parser import read_and_parse_format_file, decode_packets
+
+# Make the Allan deviation and plotter scripts importable
+repo_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(repo_root, 'Allan Deviation'))
+sys.path.append(os.path.join(repo_root, 'Data Plotter'))
+from allan_dev import (calculate_allan_deviation, find_angle_random_walk, find_rate_random_walk,
+                       find_bias_instability, plot_allan_deviation_noise)
+from plotter import plot_data
+
+def run_adev_pipeline(binary_file_path, format_file_path, data_field, Fs=100, header_bytes=b'\x48\x32\x30',
+                      csv_output=None, plot_columns=None, x_axis=None, plot_output=None, show_adev_plot=True):
+    """
+    Decodes a binary telemetry file and computes the Allan deviation of one field,
+    keeping the data in NumPy arrays instead of going through a CSV file.
+
+    Args:
+        binary_file_path (str): Path to the binary file containing the packets.
+        format_file_path (str): Path to the format file describing the packet fields.
+        data_field (str): Name of the column to analyse, as it would appear in the CSV file.
+        Fs (float, optional): Sampling frequency. Defaults to 100.
+        header_bytes (bytes, optional): Byte sequence that marks the beginning of a packet. Defaults to b'H20'.
+        csv_output (str, optional): Path of a CSV file to also write all decoded fields to. Defaults to None (no CSV).
+        plot_columns (list, optional): Columns to plot with plot_data. Defaults to None (no plot).
+        x_axis (str, optional): Column to use as the x-axis of plot_data. Defaults to index.
+        plot_output (str, optional): Path of the plot_data image. Defaults to '<binary file>_<first column>.png'.
+        show_adev_plot (bool, optional): Show the Allan deviation plot with noise parameters. Defaults to True.
+
+    Returns:
+        dict: Decoded columns ('data'), tau and adev arrays, and the noise coefficients N, K and B.
+    """
+
+    # Read and parse the format file
+    packet_format = read_and_parse_format_file(format_file_path)
+
+    # Read the binary file
+    with open(binary_file_path, 'rb') as file:
+        data = file.read()
+
+    # Decode only the fields needed, unless a full CSV is requested
+    if csv_output:
+        columns = None
+    else:
+        columns = [data_field] + (plot_columns or [])
+        if x_axis and plot_columns:
+            columns.append(x_axis)
+        columns = list(dict.fromkeys(columns))  # Remove duplicates, keep order
+    decoded = decode_packets(data, header_bytes, packet_format, columns)
+    print(f"Decoded {len(decoded[data_field])} packets from {binary_file_path}")
+
+    # Optional CSV side output, written in one go
+    if csv_output:
+        pd.DataFrame(decoded).to_csv(csv_output, index=False)
+        print(f"Wrote decoded packets to {csv_output}")
+
+    # Optional plot of the decoded channels
+    if plot_columns:
+        plot_data(binary_file_path, plot_columns, x_axis=x_axis, output_file=plot_output, data=decoded)
+
+    # Calculate Allan deviation, in double precision as when read from a CSV
+    tau, adev = calculate_allan_deviation(decoded[data_field].astype(np.float64), Fs)
+
+    # Find the noise coefficients
+    N, tauN, lineN = find_angle_random_walk(adev, tau)
+    print(f"Angle Random Walk Coefficient (N): {N}")
+
+    K, tauK, lineK = find_rate_random_walk(adev, tau)
+    print(f"Rate Random Walk Coefficient (K): {K}")
+
+    B, tauB, lineB, scfB = find_bias_instability(tau, adev)
+    print(f"Bias Instability Coefficient (B): {B}")
+
+    # Plot the Allan deviation with noise parameters
+    if show_adev_plot:
+        noise_coeffs = {'N': (N, tauN, lineN), 'K': (K, tauK, lineK), 'B': (B, tauB, lineB, scfB)}
+        plot_allan_deviation_noise(tau, adev, noise_coeffs)
+
+    return {'data': decoded, 'tau': tau, 'adev': adev, 'N': N, 'K': K, 'B': B}
+
+if __name__ == '__main__':
+
+    # Load configuration data from a JSON file
+    with open('config.json') as f:
+        config = json.load(f)
+
+    # Extract paths and parameters from the configuration
+    run_adev_pipeline(config['dataPacket'], config['packetFormat'], config['dataField'],
+                      Fs=config.get('samplingFrequency', 100),
+                      csv_output=config.get('csvOutput'),
+                      plot_columns=config.get('plotColumns'),
+                      x_axis=config.get('xAxisColumnName'),
+                      plot_output=config.get('plotOutput'))
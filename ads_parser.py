@@ -1,7 +1,11 @@
 import struct
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+# Little-endian NumPy dtypes matching the struct format characters used in packet formats
+NUMPY_TYPES = {'B': '<u1', 'H': '<u2', 'L': '<u4', 'f': '<f4'}
+
 def read_and_parse_format_file(file_path):
     """
     Reads and parses the format file to construct the packet format.
@@ -122,6 +126,92 @@ def parse_and_write_packets(data, header_bytes, packet_format, output_file):
     print(f"Processed {packet_count} packets and wrote to {output_file}")
 
 
+def column_names(field):
+    """
+    Returns the CSV column names produced for a packet field.
+
+    :param field: Dictionary containing the field format details
+    :return: List of column names, one per data element of the field
+    """
+    if int(field['length']) == 1:
+        return [field['name']]
+    field_count = int(field['format'][1:-1])  # Format strings look like '<{count}{type}'
+    return [f"{field['name']}{data_index + 1}" for data_index in range(field_count)]
+
+
+def find_packets(data, header_bytes, packet_size):
+    """
+    Finds the start offset of every valid packet in the binary data.
+
+    A packet is valid when the header bytes are found again at the position given
+    by its length byte, the same rule used by parse_and_write_packets.
+
+    :param data: Binary data to scan
+    :param header_bytes: Byte sequence indicating the start of a packet
+    :param packet_size: Size in bytes of the packet fields following the header
+    :return: NumPy array with the offset of the first field of each packet
+    """
+    starts = []
+    index = data.find(header_bytes)
+    while index != -1:
+        packet_index = index + 3
+        if packet_index + packet_size > len(data):
+            break
+
+        # Check if the next header bytes exist at expected position
+        packet_length = data[packet_index]
+        if data[index + packet_length:index + packet_length + 3] != header_bytes:
+            index = data.find(header_bytes, index + 1)
+            continue
+
+        starts.append(packet_index)
+        index = data.find(header_bytes, packet_index + packet_size)  # Move to the end of the current packet
+
+    return np.array(starts, dtype=np.int64)
+
+
+def decode_packets(data, header_bytes, packet_format, columns=None):
+    """
+    Decodes packets from binary data straight into NumPy arrays, without writing a CSV file.
+
+    :param data: Binary data to parse
+    :param header_bytes: Byte sequence indicating the start of a packet
+    :param packet_format: List of dictionaries containing packet format details
+    :param columns: Column names to decode, as they would appear in the CSV file (defaults to all)
+    :return: Dictionary mapping each column name to a NumPy array with one value per packet
+    """
+    packet_size = sum(struct.calcsize(field['format']) for field in packet_format)
+    starts = find_packets(data, header_bytes, packet_size)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    decoded = {}
+    field_offset = 0
+    for field in packet_format:
+        field_format = field['format']
+        byte_size = struct.calcsize(field_format)
+        names = column_names(field)
+
+        if columns is None or any(name in columns for name in names):
+            # Gather the bytes of this field from every packet and reinterpret them
+            dtype = NUMPY_TYPES[field_format[-1]]
+            byte_index = starts[:, None] + field_offset + np.arange(byte_size)
+            values = buffer[byte_index].view(dtype).reshape(len(starts), len(names))
+
+            for data_index, name in enumerate(names):
+                if columns is None or name in columns:
+                    decoded[name] = np.ascontiguousarray(values[:, data_index])
+
+        field_offset += byte_size
+
+    if columns is not None:
+        missing = [col for col in columns if col not in decoded]
+        if missing:
+            raise KeyError(f"Columns not found in packet format: {missing}")
+        decoded = {col: decoded[col] for col in columns}
+
+    return decoded
+
+
 if __name__ == '__main__':
     # Paths and parameters
     format_file_path = 'adsfsw_tlm.txt'
@@ -0,0 +1,160 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Version of the sidecar layout, bump it whenever the on-disk format changes
+CACHE_VERSION = 1
+
+def cache_dir_for(filename):
+    """
+    Returns the path of the sidecar cache directory for a CSV file.
+
+    Args:
+        filename (str): Path to the CSV file.
+
+    Returns:
+        str: Path to the sidecar directory (e.g. 'data.csv' -> 'data.csv.cache').
+    """
+    return filename + '.cache'
+
+def _source_signature(filename):
+    """
+    Builds the signature used to detect changes to the source CSV file.
+
+    Args:
+        filename (str): Path to the CSV file.
+
+    Returns:
+        dict: Size and modification time (in nanoseconds) of the CSV file.
+    """
+    stat = os.stat(filename)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _read_meta(cache_dir):
+    """
+    Reads the metadata file of a sidecar cache directory.
+
+    Args:
+        cache_dir (str): Path to the sidecar directory.
+
+    Returns:
+        dict: The metadata, or None if it is missing or unreadable.
+    """
+    try:
+        with open(os.path.join(cache_dir, 'meta.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _is_valid(meta, filename):
+    """
+    Checks whether a sidecar cache still matches its source CSV file.
+
+    Args:
+        meta (dict): Metadata read from the sidecar directory.
+        filename (str): Path to the CSV file.
+
+    Returns:
+        bool: True if the cache can be used, False if it must be rebuilt.
+    """
+    if meta is None or meta.get('version') != CACHE_VERSION:
+        return False
+    return meta.get('source') == _source_signature(filename)
+
+def write_cache(df, filename, source=None):
+    """
+    Writes the numeric columns of a DataFrame as one .npy file per column
+    next to the CSV file it was read from.
+
+    Non-numeric columns are not cached and are read from the CSV when requested.
+    The metadata file is written last, so an interrupted write never leaves
+    behind a cache that looks valid.
+
+    Args:
+        df (pandas.DataFrame): Data read from the CSV file.
+        filename (str): Path to the CSV file.
+        source (dict, optional): Signature of the CSV file taken before it was read.
+            Defaults to the current signature.
+    """
+    if source is None:
+        source = _source_signature(filename)
+
+    cache_dir = cache_dir_for(filename)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Remove stale metadata first so a half-written cache is never used
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    columns = {}
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        if values.dtype.kind not in 'biufc':
+            continue
+
+        # Column names may contain any character, so files are named by position
+        column_file = f'{i}.npy'
+        np.save(os.path.join(cache_dir, column_file), np.ascontiguousarray(values))
+        columns[str(col)] = column_file
+
+    meta = {
+        'version': CACHE_VERSION,
+        'source': source,
+        'columns': [str(col) for col in df.columns],
+        'cached': columns,
+    }
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+def read_csv_cached(filename, columns=None):
+    """
+    Reads a CSV file through a binary columnar sidecar cache.
+
+    On the first read the CSV is parsed with pandas and its numeric columns are
+    written to '<filename>.cache/'. Later reads memory-map only the requested
+    columns from that directory. The cache is rebuilt whenever the size or the
+    modification time of the CSV changes.
+
+    Args:
+        filename (str): Path to the CSV file.
+        columns (list, optional): Names of the columns to load. Defaults to all columns.
+
+    Returns:
+        pandas.DataFrame: The requested columns, in the requested order.
+    """
+    cache_dir = cache_dir_for(filename)
+    meta = _read_meta(cache_dir)
+
+    if not _is_valid(meta, filename):
+        # Cache missing or stale: parse the CSV once and rebuild the sidecar.
+        # The signature is taken before reading, so rows appended during the
+        # read leave the cache stale instead of silently truncated
+        source = _source_signature(filename)
+        df = pd.read_csv(filename)
+        try:
+            write_cache(df, filename, source)
+        except OSError as e:
+            print(f"Warning: could not write cache for '{filename}': {e}")
+        return df if columns is None else df[columns]
+
+    if columns is None:
+        columns = meta['columns']
+
+    missing = [col for col in columns if col not in meta['columns']]
+    if missing:
+        raise KeyError(f"Columns not found in '{filename}': {missing}")
+
+    # Columns without a cached array (e.g. text columns) come from the CSV itself
+    uncached = [col for col in columns if col not in meta['cached']]
+    uncached_df = pd.read_csv(filename, usecols=uncached) if uncached else None
+
+    data = {}
+    for col in columns:
+        if col in meta['cached']:
+            data[col] = np.load(os.path.join(cache_dir, meta['cached'][col]), mmap_mode='r')
+        else:
+            data[col] = uncached_df[col]
+
+    return pd.DataFrame(data, columns=columns)